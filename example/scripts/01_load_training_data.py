@@ -17,18 +17,18 @@ TABLE = f"{PROJECT}.{DATASET}.offline_features"
 N_ROWS = 500
 RANDOM_SEED = 42
 
-np.random.seed(RANDOM_SEED)
+rng = np.random.default_rng(RANDOM_SEED)
 
 cities = list(range(5))   # 0-4 representing 5 cities
 states = list(range(3))   # 0-2 representing 3 states
 
-bedrooms   = np.random.randint(1, 6, N_ROWS).astype(float)
-bathrooms  = np.random.randint(1, 4, N_ROWS).astype(float)
-area_sqft  = np.random.randint(800, 4000, N_ROWS).astype(float)
-lot_size   = np.random.randint(2000, 10000, N_ROWS).astype(float)
-year_built = np.random.randint(1960, 2023, N_ROWS).astype(float)
-city       = np.random.choice(cities, N_ROWS).astype(float)
-state      = np.random.choice(states, N_ROWS).astype(float)
+bedrooms   = rng.integers(1, 6, N_ROWS).astype(float)
+bathrooms  = rng.integers(1, 4, N_ROWS).astype(float)
+area_sqft  = rng.integers(800, 4000, N_ROWS).astype(float)
+lot_size   = rng.integers(2000, 10000, N_ROWS).astype(float)
+year_built = rng.integers(1960, 2023, N_ROWS).astype(float)
+city       = rng.choice(cities, N_ROWS).astype(float)
+state      = rng.choice(states, N_ROWS).astype(float)
 
 now = datetime.now(timezone.utc)
 rows = [
@@ -46,10 +46,16 @@ rows = [
     for i in range(N_ROWS)
 ]
 
+# Bulk-load with a load job (BigQuery's COPY equivalent) rather than streaming inserts
 client = bigquery.Client(project=PROJECT)
-errors = client.insert_rows_json(TABLE, rows)
-
-if errors:
-    print(f"Errors inserting rows: {errors}")
-else:
-    print(f"✓ Loaded {N_ROWS} rows into {TABLE}")
+job_config = bigquery.LoadJobConfig(
+    schema=client.get_table(TABLE).schema,
+    write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+)
+job = client.load_table_from_json(rows, TABLE, job_config=job_config)
+
+try:
+    job.result()
+    print(f"✓ Loaded {job.output_rows} rows into {TABLE}")
+except Exception as e:
+    print(f"Errors loading rows: {job.errors or e}")
@@ -27,13 +27,13 @@ df     = client.query(query).to_dataframe()
 print(f"✓ Loaded {len(df)} rows from BigQuery")
 
 # Generate target (same formula as seed_model.py)
-np.random.seed(42)
+rng = np.random.default_rng(42)
 df["price"] = (
     df["area_sqft"] * 200
     + df["bedrooms"] * 15000
     + df["bathrooms"] * 10000
     + (2023 - df["year_built"]) * -500
-    + np.random.normal(0, 10000, len(df))
+    + rng.normal(0, 10000, len(df))
 )
 
 X = df[FEATURE_COLS]
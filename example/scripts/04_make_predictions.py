@@ -18,11 +18,17 @@ client  = bigquery.Client(project=PROJECT)
 query   = f"""
     SELECT entity_id, bedrooms, bathrooms, area_sqft, lot_size, year_built, city, state
     FROM `{PROJECT}.{DATASET}.offline_features`
-    LIMIT {N_PREDICT}
+    LIMIT @n_predict
 """
-rows = list(client.query(query).result())
+job_config = bigquery.QueryJobConfig(
+    query_parameters=[bigquery.ScalarQueryParameter("n_predict", "INT64", N_PREDICT)]
+)
+rows = list(client.query(query, job_config=job_config).result())
 print(f"✓ Fetched {len(rows)} rows from offline_features")
 
+# Reuse one keep-alive connection for all prediction requests
+session = requests.Session()
+
 success = 0
 for row in rows:
     payload = {
@@ -37,7 +43,7 @@ for row in rows:
             "state":      row["state"],
         }
     }
-    resp = requests.post(f"{FASTAPI_URL}/predict", json=payload, timeout=10)
+    resp = session.post(f"{FASTAPI_URL}/predict", json=payload, timeout=10)
     if resp.status_code == 200 and resp.json().get("prediction", -1) != -1:
         success += 1
 
@@ -24,15 +24,16 @@ query = f"""
 predictions = list(client.query(query).result())
 print(f"✓ Found {len(predictions)} predictions to generate ground truth for")
 
-np.random.seed(0)
-now  = datetime.now(timezone.utc)
-rows = [
+rng   = np.random.default_rng(0)
+noise = rng.normal(0, NOISE, len(predictions))
+now   = datetime.now(timezone.utc).isoformat()
+rows  = [
     {
         "entity_id":       row["entity_id"],
-        "event_timestamp": now.isoformat(),
-        "actual_value":    float(row["predicted_value"]) + np.random.normal(0, NOISE),
+        "event_timestamp": now,
+        "actual_value":    float(row["predicted_value"]) + float(eps),
     }
-    for row in predictions
+    for row, eps in zip(predictions, noise)
 ]
 
 errors = client.insert_rows_json(f"{PROJECT}.{DATASET}.ground_truth", rows)
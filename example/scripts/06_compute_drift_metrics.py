@@ -6,7 +6,6 @@ Metrics computed:
 - mae: mean absolute error between predictions and ground truth
 """
 import os
-import numpy as np
 from datetime import datetime, timezone
 from google.cloud import bigquery
 from dotenv import load_dotenv
@@ -17,29 +16,42 @@ PROJECT      = os.environ["BIGQUERY_PROJECT"]
 DATASET      = os.getenv("BIGQUERY_DATASET", "mlops")
 FEATURE_COLS = ["bedrooms", "bathrooms", "area_sqft", "lot_size", "year_built", "city", "state"]
 
+FEATURE_AVGS = ", ".join(f"AVG({col}) AS {col}" for col in FEATURE_COLS)
+
 client = bigquery.Client(project=PROJECT)
 
+# Feature means are computed in BigQuery so only one row per query comes back.
 # Training feature distributions (baseline)
-train_query = f"SELECT {', '.join(FEATURE_COLS)} FROM `{PROJECT}.{DATASET}.offline_features`"
-train_df    = client.query(train_query).to_dataframe()
+train_query = f"SELECT {FEATURE_AVGS} FROM `{PROJECT}.{DATASET}.offline_features`"
 
 # Recent predictions (simulate "serving" features by using training data subset as proxy)
 # In production you'd log features alongside predictions and query those
 recent_query = f"""
-    SELECT {', '.join(FEATURE_COLS)}
-    FROM `{PROJECT}.{DATASET}.offline_features`
-    ORDER BY event_timestamp DESC
-    LIMIT 50
+    SELECT {FEATURE_AVGS}
+    FROM (
+        SELECT {', '.join(FEATURE_COLS)}
+        FROM `{PROJECT}.{DATASET}.offline_features`
+        ORDER BY event_timestamp DESC
+        LIMIT 50
+    )
 """
-recent_df = client.query(recent_query).to_dataframe()
 
-# MAE from ground truth vs predictions
+# MAE from ground truth vs predictions, aggregated in BigQuery so only one row comes back
 mae_query = f"""
-    SELECT p.predicted_value, g.actual_value
+    SELECT COUNT(*) AS n, AVG(ABS(p.predicted_value - g.actual_value)) AS mae
     FROM `{PROJECT}.{DATASET}.predictions` p
     JOIN `{PROJECT}.{DATASET}.ground_truth` g USING (entity_id)
 """
-mae_df = client.query(mae_query).to_dataframe()
+
+# The three queries are independent: submit them all so BigQuery runs them
+# concurrently, then wait for each result.
+train_job  = client.query(train_query)
+recent_job = client.query(recent_query)
+mae_job    = client.query(mae_query)
+
+train_means  = train_job.to_dataframe().iloc[0]
+recent_means = recent_job.to_dataframe().iloc[0]
+mae_row      = next(iter(mae_job.result()))
 
 now        = datetime.now(timezone.utc)
 window_end = now
@@ -47,21 +59,21 @@ window_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 rows = []
 
 # Feature mean shift per feature
-for col in FEATURE_COLS:
-    shift = float(recent_df[col].mean() - train_df[col].mean())
+shifts = recent_means[FEATURE_COLS] - train_means[FEATURE_COLS]
+for col, shift in shifts.items():
     rows.append({
         "metric_timestamp": now.isoformat(),
         "metric_type":      "feature_mean_shift",
         "feature_name":     col,
-        "value":            shift,
+        "value":            float(shift),
         "window_start":     window_start.isoformat(),
         "window_end":       window_end.isoformat(),
         "model_version":    "HousingPriceModel/Production",
     })
 
 # MAE
-if len(mae_df) > 0:
-    mae = float(np.mean(np.abs(mae_df["predicted_value"] - mae_df["actual_value"])))
+if mae_row["n"] > 0:
+    mae = float(mae_row["mae"])
     rows.append({
         "metric_timestamp": now.isoformat(),
         "metric_type":      "mae",
@@ -61,29 +61,35 @@ def build_dashboard(ds_uid: str) -> dict:
             "format":     "time_series",
         }
 
+    # Every panel only returns rows inside the dashboard time range (and, when
+    # the tables are deployed with partition_tables, BigQuery also prunes to the
+    # matching day partitions); prediction panels aggregate per minute so the
+    # result is one row per bucket rather than one per prediction.
     predictions_sql = f"""
-SELECT prediction_timestamp AS time, COUNT(*) AS prediction_count
+SELECT TIMESTAMP_TRUNC(prediction_timestamp, MINUTE) AS time, COUNT(*) AS prediction_count
 FROM `{PROJECT}.{DATASET}.predictions`
+WHERE $__timeFilter(prediction_timestamp)
 GROUP BY time ORDER BY time
 """.strip()
 
     mean_pred_sql = f"""
-SELECT prediction_timestamp AS time, AVG(predicted_value) AS mean_prediction
+SELECT TIMESTAMP_TRUNC(prediction_timestamp, MINUTE) AS time, AVG(predicted_value) AS mean_prediction
 FROM `{PROJECT}.{DATASET}.predictions`
+WHERE $__timeFilter(prediction_timestamp)
 GROUP BY time ORDER BY time
 """.strip()
 
     drift_sql = f"""
 SELECT metric_timestamp AS time, feature_name, value AS mean_shift
 FROM `{PROJECT}.{DATASET}.drift_metrics`
-WHERE metric_type = 'feature_mean_shift'
+WHERE metric_type = 'feature_mean_shift' AND $__timeFilter(metric_timestamp)
 ORDER BY time
 """.strip()
 
     mae_sql = f"""
 SELECT metric_timestamp AS time, value AS mae
 FROM `{PROJECT}.{DATASET}.drift_metrics`
-WHERE metric_type = 'mae'
+WHERE metric_type = 'mae' AND $__timeFilter(metric_timestamp)
 ORDER BY time
 """.strip()
 
@@ -115,6 +121,7 @@ ORDER BY time
             "title":      "Housing Price Model Monitoring",
             "tags":       ["mlops", "deployml"],
             "timezone":   "browser",
+            "time":       {"from": "now-7d", "to": "now"},
             "panels":     panels,
             "schemaVersion": 36,
             "version":    1,
@@ -1,15 +1,36 @@
-# Import notebook functionality for easy access
-from .notebook import deploy, load, DeploymentStack, ServiceURLs
+import importlib
 
-# Import diagnostics for easy access
-from .diagnostics import run_doctor, check_system, DeployMLDoctor
+# Notebook and diagnostics helpers are exposed here for easy access, but
+# imported on first use so importing a single entry point stays cheap
+_LAZY = {
+    'deploy': 'notebook',
+    'load': 'notebook',
+    'DeploymentStack': 'notebook',
+    'ServiceURLs': 'notebook',
+    'run_doctor': 'diagnostics',
+    'check_system': 'diagnostics',
+    'DeployMLDoctor': 'diagnostics',
+}
 
 __all__ = [
-    'deploy', 
-    'load', 
+    'deploy',
+    'load',
     'DeploymentStack',
     'ServiceURLs',
     'run_doctor',
-    'check_system', 
+    'check_system',
     'DeployMLDoctor'
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,29 +1,95 @@
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+import asyncio
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 import uuid
+import warnings
+from collections import OrderedDict
 from datetime import datetime, timezone
+import numpy as np
 import pandas as pd
 import mlflow
 import mlflow.pyfunc
+from mlflow.tracking import MlflowClient
 
 app = FastAPI(
     title="FastAPI Demo",
     description="Simple FastAPI application for Kubernetes deployment demo",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 MLFLOW_TRACKING_URI = os.getenv("MLFLOW_TRACKING_URI", "http://mlflow-service:5000")
 MODEL_NAME = os.getenv("MODEL_NAME", "HousingPriceModel")
 BIGQUERY_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT", "")
 BIGQUERY_DATASET = os.getenv("BIGQUERY_DATASET", "mlops")
+PREDICTIONS_TABLE = f"{BIGQUERY_PROJECT}.{BIGQUERY_DATASET}.predictions"
+MODEL_USED = f"MLflow: {MODEL_NAME}"
+
+# Micro-batching: concurrent /predict calls are coalesced into one model.predict
+# call. A good MAX_BATCH is roughly peak QPS x single-batch execution time.
+MAX_BATCH = int(os.getenv("MAX_BATCH", "32"))
+MAX_WAIT_MS = float(os.getenv("MAX_WAIT_MS", "5"))
+# Minimum seconds between MLflow load attempts while no model is available
+MODEL_RETRY_SECONDS = float(os.getenv("MODEL_RETRY_SECONDS", "30"))
+# Interval for checking the registry for a newly promoted Production version; 0 disables
+MODEL_REFRESH_SECONDS = float(os.getenv("MODEL_REFRESH_SECONDS", "60"))
+# Interval for the background MLflow connectivity check reported by /health
+MLFLOW_PING_SECONDS = float(os.getenv("MLFLOW_PING_SECONDS", "10"))
+# Response timestamps are refreshed on this interval instead of formatted per request
+CLOCK_TICK_SECONDS = float(os.getenv("CLOCK_TICK_SECONDS", "0.25"))
+# LRU cache of predictions keyed by feature values; 0 disables it
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", "10000"))
+# Prediction logs are buffered and written to BigQuery in batches of up to
+# LOG_BATCH_SIZE rows, at most LOG_FLUSH_SECONDS after the first buffered row.
+# 500 rows is BigQuery's recommended maximum per streaming insert request.
+LOG_BATCH_SIZE = int(os.getenv("LOG_BATCH_SIZE", "500"))
+LOG_FLUSH_SECONDS = float(os.getenv("LOG_FLUSH_SECONDS", "1"))
+# Rows beyond this many waiting for BigQuery are dropped so a slow or
+# unavailable BigQuery cannot grow memory without bound
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", str(LOG_BATCH_SIZE * 20)))
+
+# A single dedicated thread runs inference so the event loop stays free and the
+# model's thread-local state stays warm; batching already serializes calls.
+inference_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference")
 
 model = None
+predict_fn = None
+feature_dtype = np.float64
+model_warmed = False
+model_version = None
+last_load_attempt = 0.0
+model_load_lock = None
+mlflow.set_tracking_uri(MLFLOW_TRACKING_URI)
+mlflow_client = MlflowClient(tracking_uri=MLFLOW_TRACKING_URI)
+mlflow_connected = False
+now_iso = datetime.now().isoformat()
+prediction_cache = OrderedDict()
+cache_stats = {"hits": 0, "misses": 0}
 bq_client = None
+prediction_queue = None
+log_queue = None
+pending_log_rows = []
+background_tasks = []
 
-FEATURE_ORDER = ['bedrooms', 'bathrooms', 'area_sqft', 'lot_size', 'year_built', 'city', 'state']
+FEATURE_ORDER = ('bedrooms', 'bathrooms', 'area_sqft', 'lot_size', 'year_built', 'city', 'state')
+WARMUP_FEATURES = (3, 2, 1500, 5000, 2000, 0, 0)
+WARMUP_ROUNDS = 3
+
+
+def build_feature_extractor(feature_order):
+    """Generate a function with one unrolled dict lookup per feature, in order."""
+    lookups = "".join(f"features.get({name!r}, 0.0), " for name in feature_order)
+    namespace = {}
+    exec(f"def extract_features(features):\n    return ({lookups})", namespace)
+    return namespace["extract_features"]
+
+
+extract_features = build_feature_extractor(FEATURE_ORDER)
 
 
 class PredictionRequest(BaseModel):
@@ -44,21 +110,118 @@ class HealthResponse(BaseModel):
     port: int
     mlflow_connected: bool
     model_loaded: bool
+    model_warmed: bool
+    cache_hits: int
+    cache_misses: int
 
 
-def load_model_from_mlflow():
-    global model
+def is_tree_model(estimator) -> bool:
+    """sklearn trees and forests convert their input to float32 before predicting."""
+    from sklearn.ensemble import BaseEnsemble
+    from sklearn.tree import BaseDecisionTree
+    if isinstance(estimator, BaseDecisionTree):
+        return True
+    return isinstance(estimator, BaseEnsemble) and all(
+        isinstance(e, BaseDecisionTree) for e in getattr(estimator, "estimators_", [])
+    )
+
+
+def resolve_predict_fn(loaded_model):
+    """Return a predict callable that accepts a 2-D float ndarray, and the dtype to build it in.
+
+    sklearn models fitted without feature names, or with exactly FEATURE_ORDER,
+    are called directly, skipping pyfunc's DataFrame handling; tree models are
+    fed float32 so sklearn does not copy the input to convert it. Anything else
+    gets the array wrapped in a DataFrame once per batch, so pyfunc's schema
+    enforcement matches columns by name.
+    """
+    def predict_frame(X):
+        return loaded_model.predict(pd.DataFrame(X, columns=FEATURE_ORDER, copy=False))
+
+    estimator = getattr(getattr(loaded_model, "_model_impl", None), "sklearn_model", None)
+    if estimator is None:
+        return predict_frame, np.float64
+
+    feature_names = getattr(estimator, "feature_names_in_", None)
+    if feature_names is not None and tuple(feature_names) != FEATURE_ORDER:
+        return predict_frame, np.float64
+
+    def predict_array(X):
+        # The columns are already in the fitted order; only the names are dropped.
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="X does not have valid feature names")
+            return estimator.predict(X)
+
+    dtype = np.float32 if is_tree_model(estimator) else np.float64
+    try:
+        predict_array(np.array([WARMUP_FEATURES], dtype=dtype))
+    except Exception as e:
+        print(f"⚠️  Model rejected ndarray input, using DataFrame input: {e}")
+        return predict_frame, np.float64
+    return predict_array, dtype
+
+
+def warm_up_model(fn, dtype) -> bool:
+    """Run a few throwaway predictions so lazy initialization happens before real traffic."""
     try:
-        mlflow.set_tracking_uri(MLFLOW_TRACKING_URI)
-        model = mlflow.pyfunc.load_model(f"models:/{MODEL_NAME}/Production")
-        print(f"✓ Loaded model '{MODEL_NAME}' from Production stage")
+        X = np.array([WARMUP_FEATURES], dtype=dtype)
+        for _ in range(WARMUP_ROUNDS):
+            fn(X)
+        print("✓ Model warmed up")
         return True
     except Exception as e:
-        print(f"⚠️  Could not load model from MLflow: {e}")
-        model = None
+        print(f"⚠️  Model warmup failed: {e}")
         return False
 
 
+def get_cached_prediction(key: tuple) -> Optional[float]:
+    prediction = prediction_cache.get(key)
+    if prediction is None:
+        cache_stats["misses"] += 1
+        return None
+    prediction_cache.move_to_end(key)
+    cache_stats["hits"] += 1
+    return prediction
+
+
+def cache_prediction(key: tuple, prediction: float):
+    if PREDICTION_CACHE_SIZE <= 0:
+        return
+    prediction_cache[key] = prediction
+    if len(prediction_cache) > PREDICTION_CACHE_SIZE:
+        prediction_cache.popitem(last=False)
+
+
+def latest_production_version() -> Optional[str]:
+    versions = mlflow_client.get_latest_versions(MODEL_NAME, stages=["Production"])
+    return versions[0].version if versions else None
+
+
+def load_model_from_mlflow():
+    """Load and warm the current Production model without touching the served one.
+
+    Runs on a worker thread; returns (model, predict_fn, dtype, warmed, version),
+    or None on failure so the previously loaded model (if any) keeps serving.
+    """
+    try:
+        version = latest_production_version()
+        loaded = mlflow.pyfunc.load_model(f"models:/{MODEL_NAME}/{version or 'Production'}")
+        loaded_predict_fn, loaded_dtype = resolve_predict_fn(loaded)
+        print(f"✓ Loaded model '{MODEL_NAME}' version {version} from Production stage")
+        warmed = warm_up_model(loaded_predict_fn, loaded_dtype)
+        return loaded, loaded_predict_fn, loaded_dtype, warmed, version
+    except Exception as e:
+        print(f"⚠️  Could not load model from MLflow: {e}")
+        return None
+
+
+def install_model(loaded):
+    """Swap in a model returned by load_model_from_mlflow; called on the event loop only."""
+    global model, predict_fn, feature_dtype, model_warmed, model_version
+    model, predict_fn, feature_dtype, model_warmed, model_version = loaded
+    prediction_cache.clear()
+
+
 def init_bigquery():
     global bq_client
     if not BIGQUERY_PROJECT:
@@ -72,28 +235,147 @@ def init_bigquery():
         bq_client = None
 
 
-def log_prediction_to_bigquery(entity_id: str, predicted_value: float, model_version: str):
-    if bq_client is None:
+def prediction_log_row(entity_id: str, predicted_value: float, model_version: str, logged_at: str) -> dict:
+    return {
+        "prediction_id": str(uuid.uuid4()),
+        "entity_id": entity_id,
+        "prediction_timestamp": logged_at,
+        "predicted_value": predicted_value,
+        "model_version": model_version,
+        "feature_snapshot_timestamp": logged_at,
+    }
+
+
+def log_predictions_to_bigquery(rows: List[dict]):
+    if bq_client is None or not rows:
         return
     try:
-        table_id = f"{BIGQUERY_PROJECT}.{BIGQUERY_DATASET}.predictions"
-        row = {
-            "prediction_id": str(uuid.uuid4()),
-            "entity_id": entity_id,
-            "prediction_timestamp": datetime.now(timezone.utc).isoformat(),
-            "predicted_value": predicted_value,
-            "model_version": model_version,
-            "feature_snapshot_timestamp": datetime.now(timezone.utc).isoformat(),
-        }
-        bq_client.insert_rows_json(table_id, [row])
+        bq_client.insert_rows_json(PREDICTIONS_TABLE, rows)
     except Exception as e:
         print(f"⚠️  Could not log prediction to BigQuery: {e}")
 
 
+def queue_prediction_logs(rows: List[dict]):
+    """Hand rows to the background flusher; the request never waits on BigQuery."""
+    if bq_client is None:
+        return
+    for index, row in enumerate(rows):
+        try:
+            log_queue.put_nowait(row)
+        except asyncio.QueueFull:
+            print(f"⚠️  Prediction log queue full, dropping {len(rows) - index} row(s)")
+            return
+
+
+def _drain_queue(queue: asyncio.Queue, items: list, limit: int):
+    while len(items) < limit:
+        try:
+            items.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+
+
+async def prediction_log_flusher():
+    """Write queued prediction log rows to BigQuery in batches.
+
+    Rows taken off the queue wait in pending_log_rows until their write is
+    dispatched, so the shutdown flush can pick them up if this task is cancelled.
+    """
+    global pending_log_rows
+    loop = asyncio.get_running_loop()
+    while True:
+        pending_log_rows.append(await log_queue.get())
+        _drain_queue(log_queue, pending_log_rows, LOG_BATCH_SIZE)
+        if len(pending_log_rows) < LOG_BATCH_SIZE:
+            await asyncio.sleep(LOG_FLUSH_SECONDS)
+            _drain_queue(log_queue, pending_log_rows, LOG_BATCH_SIZE)
+        rows, pending_log_rows = pending_log_rows, []
+        await loop.run_in_executor(None, log_predictions_to_bigquery, rows)
+
+
+async def batch_predict_worker():
+    """Collect queued requests for up to MAX_WAIT_MS and predict them in one call."""
+    loop = asyncio.get_running_loop()
+    while True:
+        items = [await prediction_queue.get()]
+        _drain_queue(prediction_queue, items, MAX_BATCH)
+        if len(items) < MAX_BATCH:
+            await asyncio.sleep(MAX_WAIT_MS / 1000)
+            _drain_queue(prediction_queue, items, MAX_BATCH)
+
+        vectors, futures = zip(*items)
+        try:
+            predictions = await loop.run_in_executor(inference_executor, predict_fn, np.array(vectors, dtype=feature_dtype))
+            for future, prediction in zip(futures, predictions):
+                if not future.done():
+                    future.set_result(float(prediction))
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+
+
+async def mlflow_ping_loop():
+    """Refresh mlflow_connected in the background so /health never waits on MLflow."""
+    global mlflow_connected
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            await loop.run_in_executor(None, lambda: mlflow_client.search_experiments(max_results=1))
+            mlflow_connected = True
+        except Exception:
+            mlflow_connected = False
+        await asyncio.sleep(MLFLOW_PING_SECONDS)
+
+
+async def model_refresh_loop():
+    """Reload the model when a new version is promoted to Production."""
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(MODEL_REFRESH_SECONDS)
+        try:
+            version = await loop.run_in_executor(None, latest_production_version)
+        except Exception as e:
+            print(f"⚠️  Could not check for a new model version: {e}")
+            continue
+        if version is not None and version != model_version and not model_load_lock.locked():
+            await reload_model()
+
+
+async def clock_tick_loop():
+    """Keep now_iso current so request handlers do not format timestamps themselves."""
+    global now_iso
+    while True:
+        now_iso = datetime.now().isoformat()
+        await asyncio.sleep(CLOCK_TICK_SECONDS)
+
+
 @app.on_event("startup")
 async def startup_event():
-    load_model_from_mlflow()
+    global prediction_queue, log_queue, model_load_lock
+    model_load_lock = asyncio.Lock()
+    await reload_model()
     init_bigquery()
+    prediction_queue = asyncio.Queue()
+    log_queue = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
+    background_tasks.append(asyncio.create_task(batch_predict_worker()))
+    background_tasks.append(asyncio.create_task(mlflow_ping_loop()))
+    background_tasks.append(asyncio.create_task(clock_tick_loop()))
+    background_tasks.append(asyncio.create_task(prediction_log_flusher()))
+    if MODEL_REFRESH_SECONDS > 0:
+        background_tasks.append(asyncio.create_task(model_refresh_loop()))
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    if log_queue is not None:
+        rows = pending_log_rows
+        _drain_queue(log_queue, rows, len(rows) + log_queue.qsize())
+        for start in range(0, len(rows), LOG_BATCH_SIZE):
+            log_predictions_to_bigquery(rows[start:start + LOG_BATCH_SIZE])
 
 
 @app.get("/")
@@ -104,7 +386,7 @@ async def root():
         "model_loaded": model is not None,
         "model_name": MODEL_NAME,
         "mlflow_uri": MLFLOW_TRACKING_URI,
-        "endpoints": {"health": "/health", "predict": "/predict", "docs": "/docs"}
+        "endpoints": {"health": "/health", "predict": "/predict", "predict_batch": "/predict/batch", "docs": "/docs"}
     }
 
 
@@ -113,52 +395,122 @@ async def health():
     port = int(os.getenv("PORT", "8000"))
     return HealthResponse(
         status="healthy",
-        timestamp=datetime.now().isoformat(),
+        timestamp=now_iso,
         port=port,
-        mlflow_connected=True,
-        model_loaded=model is not None
+        mlflow_connected=mlflow_connected,
+        model_loaded=model is not None,
+        model_warmed=model_warmed,
+        cache_hits=cache_stats["hits"],
+        cache_misses=cache_stats["misses"]
     )
 
 
+async def reload_model():
+    """Load the model on a worker thread and swap it in; only one load runs at a time."""
+    global last_load_attempt
+    async with model_load_lock:
+        last_load_attempt = time.monotonic()
+        loaded = await asyncio.get_running_loop().run_in_executor(None, load_model_from_mlflow)
+        if loaded is not None:
+            install_model(loaded)
+
+
+async def ensure_model_loaded():
+    if model is not None:
+        return
+    if model_load_lock.locked():
+        # Wait for the load already in flight instead of starting another
+        async with model_load_lock:
+            return
+    if time.monotonic() - last_load_attempt >= MODEL_RETRY_SECONDS:
+        await reload_model()
+
+
 @app.post("/predict", response_model=PredictionResponse)
 async def predict(request: PredictionRequest):
-    global model
-
     entity_id = request.entity_id or str(uuid.uuid4())
 
-    if model is None:
-        load_model_from_mlflow()
+    await ensure_model_loaded()
 
     if model is None:
         return PredictionResponse(
             prediction=-1.0,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
             model_used=None,
             entity_id=entity_id
         )
 
     try:
-        feature_values = [request.features.get(f, 0.0) for f in FEATURE_ORDER]
-        X = pd.DataFrame([feature_values], columns=FEATURE_ORDER)
-
-        prediction = float(model.predict(X)[0])
-        model_version = f"MLflow: {MODEL_NAME}"
-
-        log_prediction_to_bigquery(entity_id, prediction, model_version)
+        feature_values = extract_features(request.features)
+        # Keyed by version so a batch that finishes on the old model after a
+        # swap cannot populate the cache for the new one
+        cache_key = (model_version, feature_values)
+        prediction = get_cached_prediction(cache_key)
+        if prediction is None:
+            future = asyncio.get_running_loop().create_future()
+            await prediction_queue.put((feature_values, future))
+            prediction = await future
+            cache_prediction(cache_key, prediction)
+        logged_at = datetime.now(timezone.utc).isoformat()
+        queue_prediction_logs([prediction_log_row(entity_id, prediction, MODEL_USED, logged_at)])
 
         return PredictionResponse(
             prediction=prediction,
-            timestamp=datetime.now().isoformat(),
-            model_used=model_version,
+            timestamp=now_iso,
+            model_used=MODEL_USED,
             entity_id=entity_id
         )
     except Exception as e:
         return PredictionResponse(
             prediction=-1.0,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
+            model_used=None,
+            entity_id=entity_id
+        )
+
+
+@app.post("/predict/batch", response_model=List[PredictionResponse])
+async def predict_batch(batch: List[PredictionRequest]):
+    """Predict many rows with a single vectorized model call."""
+    entity_ids = [request.entity_id or str(uuid.uuid4()) for request in batch]
+    if not batch:
+        return []
+
+    await ensure_model_loaded()
+
+    if model is not None:
+        try:
+            X = np.array([extract_features(request.features) for request in batch], dtype=feature_dtype)
+            predictions = await asyncio.get_running_loop().run_in_executor(inference_executor, predict_fn, X)
+            predictions = [float(p) for p in predictions]
+
+            logged_at = datetime.now(timezone.utc).isoformat()
+            queue_prediction_logs([
+                prediction_log_row(entity_id, prediction, MODEL_USED, logged_at)
+                for entity_id, prediction in zip(entity_ids, predictions)
+            ])
+
+            return [
+                PredictionResponse(
+                    prediction=prediction,
+                    timestamp=now_iso,
+                    model_used=MODEL_USED,
+                    entity_id=entity_id
+                )
+                for entity_id, prediction in zip(entity_ids, predictions)
+            ]
+        except Exception as e:
+            print(f"⚠️  Batch prediction failed: {e}")
+
+    return [
+        PredictionResponse(
+            prediction=-1.0,
+            timestamp=now_iso,
             model_used=None,
             entity_id=entity_id
         )
+        for entity_id in entity_ids
+    ]
 
 
 if __name__ == "__main__":
@@ -9,6 +9,14 @@ resource "google_bigquery_dataset" "mlops" {
   table_id   = "drift_metrics"
   project    = var.project_id
 
+  dynamic "time_partitioning" {
+    for_each = var.partition_tables ? [1] : []
+    content {
+      type  = "DAY"
+      field = "metric_timestamp"
+    }
+  }
+
   schema = file("${path.module}/schemas/drift_metrics.json")
   deletion_protection = false
 }
@@ -18,6 +26,15 @@ resource "google_bigquery_table" "ground_truth" {
   table_id   = "ground_truth"
   project    = var.project_id
 
+  dynamic "time_partitioning" {
+    for_each = var.partition_tables ? [1] : []
+    content {
+      type  = "DAY"
+      field = "event_timestamp"
+    }
+  }
+  clustering = var.partition_tables ? ["entity_id"] : null
+
   schema = file("${path.module}/schemas/ground_truth.json")
   deletion_protection = false
 }
@@ -27,6 +44,14 @@ resource "google_bigquery_table" "offline_features" {
   table_id   = "offline_features"
   project    = var.project_id
 
+  dynamic "time_partitioning" {
+    for_each = var.partition_tables ? [1] : []
+    content {
+      type  = "DAY"
+      field = "event_timestamp"
+    }
+  }
+
   schema = file("${path.module}/schemas/offline_features.json")
   deletion_protection = false
 }
@@ -36,6 +61,15 @@ resource "google_bigquery_table" "predictions" {
   table_id   = "predictions"
   project    = var.project_id
 
+  dynamic "time_partitioning" {
+    for_each = var.partition_tables ? [1] : []
+    content {
+      type  = "DAY"
+      field = "prediction_timestamp"
+    }
+  }
+  clustering = var.partition_tables ? ["entity_id"] : null
+
   schema = file("${path.module}/schemas/predictions.json")
   deletion_protection = false
 }
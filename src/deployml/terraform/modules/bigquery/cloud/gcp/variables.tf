@@ -8,4 +8,22 @@ variable "region" {
 
 variable "dataset_id" {
   type = string
-}
\ No newline at end of file
+}
+
+variable "partition_tables" {
+  type        = bool
+  default     = false
+  description = <<-EOT
+    Day-partition the tables on their event timestamp and cluster predictions
+    and ground_truth on entity_id. Changing this on existing tables makes
+    Terraform replace them, so only enable it for new datasets or after
+    migrating, e.g. for predictions:
+      CREATE TABLE mlops.predictions_partitioned
+      PARTITION BY DATE(prediction_timestamp) CLUSTER BY entity_id
+      AS SELECT * FROM mlops.predictions;
+      DROP TABLE mlops.predictions;
+      ALTER TABLE mlops.predictions_partitioned RENAME TO predictions;
+    Once every table is migrated, Terraform sees the partitioned tables and
+    enabling this plans no replacement.
+  EOT
+}
@@ -1,44 +1,315 @@
+import functools
+import hashlib
+import json
+import os
+import shutil
 import subprocess
+import time
+import requests
 import typer
+import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict
-from jinja2 import Environment, FileSystemLoader
+from typing import Optional, Dict, Tuple
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from deployml.utils.constants import TEMPLATE_DIR
 
+# Resolved once so each call execs an absolute path instead of searching PATH.
+# Fall back to the bare name so a missing binary still raises FileNotFoundError.
+_KUBECTL = shutil.which("kubectl") or "kubectl"
+_MINIKUBE = shutil.which("minikube") or "minikube"
+
+# Names of the FastAPI deployment and NodePort service rendered by the templates
+_DEPLOYMENT_NAME = "fastapi-deployment"
+_SERVICE_NAME = "fastapi-service"
+
+# Written next to applied manifests: a digest of their contents plus the uid
+# and generation of the Deployment they produced
+_APPLIED_MARKER = ".deployml.applied"
+
+# Default template parameters for the local FastAPI and MLflow manifests
+_FASTAPI_DEPLOYMENT_CTX = {
+    "port": 8000,
+    "replicas": 1,
+    "cpu_request": "250m",
+    "memory_request": "512Mi",
+    "cpu_limit": "500m",
+    "memory_limit": "1Gi",
+}
+_FASTAPI_SERVICE_CTX = {
+    "service_name": _SERVICE_NAME,
+    "port": 8000,
+    "node_port": 30080,
+}
+_MLFLOW_DEPLOYMENT_CTX = {
+    "port": 5000,
+    "replicas": 1,
+    "cpu_request": "250m",
+    "memory_request": "512Mi",
+    "cpu_limit": "500m",
+    "memory_limit": "1Gi",
+}
+_MLFLOW_SERVICE_CTX = {
+    "service_name": "mlflow-service",
+    "port": 5000,
+    "node_port": 30050,
+}
+
+# Seconds a check_minikube_running result is reused before probing again
+_STATUS_TTL_SECONDS = 1.0
+_status_cache = {"checked_at": 0.0, "running": False}
+_api_session = requests.Session()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_environment() -> Environment:
+    """Jinja environment for the local manifests, built once per process.
+
+    Templates ship with the package and do not change at runtime, so
+    auto_reload is off and every compiled template is kept. Compiled
+    bytecode is also cached on disk (in Jinja's per-user temp directory)
+    so later CLI runs skip parsing and compiling the templates.
+    """
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR / "kubernetes_local")),
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
+        cache_size=-1,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_templates(
+    deployment_name: str = "deployment.yaml.j2",
+    service_name: str = "service.yaml.j2",
+):
+    """Return the compiled (deployment_template, service_template) pair."""
+    env = _get_environment()
+    return env.get_template(deployment_name), env.get_template(service_name)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_fastapi_manifests(image: str, mlflow_tracking_uri: Optional[str] = None):
+    """
+    Render the FastAPI deployment and service manifests as UTF-8 bytes.
+
+    Every other template parameter is a fixed default, so the output depends
+    only on the image and tracking URI and repeated calls skip rendering.
+    """
+    deployment_template, service_template = _get_templates()
+    
+    # Render templates
+    deployment_yaml = deployment_template.render(
+        image=image,
+        mlflow_tracking_uri=mlflow_tracking_uri,
+        **_FASTAPI_DEPLOYMENT_CTX
+    )
+    service_yaml = service_template.render(_FASTAPI_SERVICE_CTX)
+    
+    return deployment_yaml.encode("utf-8"), service_yaml.encode("utf-8")
+
+
+@functools.lru_cache(maxsize=1)
+def _minikube_api_server() -> Optional[Tuple[str, str]]:
+    """Return the minikube API server URL and CA file from kubeconfig, if present."""
+    kubeconfig = os.environ.get("KUBECONFIG", "").split(os.pathsep)[0]
+    kubeconfig_path = Path(kubeconfig) if kubeconfig else Path.home() / ".kube" / "config"
+    try:
+        config = yaml.safe_load(kubeconfig_path.read_text()) or {}
+    except (OSError, yaml.YAMLError):
+        return None
+    
+    for entry in config.get("clusters") or []:
+        if entry.get("name") == "minikube":
+            cluster = entry.get("cluster") or {}
+            if cluster.get("server") and cluster.get("certificate-authority"):
+                return cluster["server"], cluster["certificate-authority"]
+    return None
+
+
+def _probe_minikube() -> bool:
+    """
+    Ask the minikube API server's /healthz endpoint whether the cluster is up.
+    
+    Falls back to `minikube status` when kubeconfig has no minikube cluster
+    or the API server cannot be reached.
+    """
+    api_server = _minikube_api_server()
+    if api_server:
+        server, ca_file = api_server
+        try:
+            response = _api_session.get(f"{server}/healthz", verify=ca_file, timeout=1.0)
+            if response.status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+    
+    result = subprocess.run(
+        [_MINIKUBE, "status"],
+        capture_output=True
+    )
+    return b"Running" in result.stdout
+
+
+@functools.lru_cache(maxsize=1)
+def _minikube_ip() -> str:
+    """Return the minikube node IP, which is stable for the life of the cluster.
+
+    Raises CalledProcessError on failure so that failures are not cached.
+    """
+    result = subprocess.run(
+        [_MINIKUBE, "ip"],
+        check=True,
+        capture_output=True,
+        text=True
+    )
+    return result.stdout.strip()
+
+
+def _node_port(service_json: bytes) -> Optional[int]:
+    """Return the first NodePort from `kubectl get svc -o json` output, if present."""
+    try:
+        return json.loads(service_json)["spec"]["ports"][0]["nodePort"]
+    except (ValueError, KeyError, IndexError, TypeError):
+        return None
+
 
 def check_minikube_running() -> bool:
     """Check if minikube is currently running."""
+    now = time.monotonic()
+    if now - _status_cache["checked_at"] < _STATUS_TTL_SECONDS:
+        return _status_cache["running"]
+    
     try:
-        result = subprocess.run(
-            ["minikube", "status"],
-            capture_output=True,
-            text=True
-        )
-        return "Running" in result.stdout
+        running = _probe_minikube()
     except Exception:
-        return False
+        running = False
+    _status_cache.update(checked_at=now, running=running)
+    return running
 
 
 def start_minikube() -> bool:
-    """Start minikube cluster."""
+    """Start minikube cluster, unless it is already running."""
+    if check_minikube_running():
+        typer.echo("Minikube is already running.")
+        return True
+    
     typer.echo("Starting minikube...")
     try:
         result = subprocess.run(
-            ["minikube", "start"],
+            [_MINIKUBE, "start"],
             check=True,
-            capture_output=True,
-            text=True
+            capture_output=True
         )
+        # A (re)started cluster may have a new IP and rewritten kubeconfig
+        _minikube_api_server.cache_clear()
+        _minikube_ip.cache_clear()
+        _status_cache["checked_at"] = 0.0
         typer.echo("Minikube started successfully!")
         return True
     except subprocess.CalledProcessError as e:
-        typer.echo(f"Failed to start minikube: {e.stderr}")
+        typer.echo(f"Failed to start minikube: {e.stderr.decode('utf-8', 'replace')}")
         return False
     except FileNotFoundError:
         typer.echo("minikube command not found. Please install minikube first.")
         return False
 
 
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    Write data to path unless the file already holds exactly these bytes.
+    
+    Leaving unchanged manifests untouched keeps their mtime stable for file
+    watchers. Manifests are a few hundred bytes, so comparing contents
+    directly is cheaper than hashing both sides.
+    """
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def _manifest_digest(*files: Path) -> str:
+    """Return a short digest of the combined contents of the given files."""
+    digest = hashlib.blake2b(digest_size=16)
+    for file in files:
+        digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def _deployment_state() -> Optional[Dict]:
+    """
+    Return the uid, generation and rollout health of the live FastAPI deployment.
+    
+    Any spec change (another apply, `kubectl set image`, a recreate) changes
+    the uid or generation, so together they identify what is running. The
+    service is fetched in the same call; None is returned if either is missing.
+    """
+    try:
+        result = subprocess.run(
+            [
+                _KUBECTL, "get",
+                f"deployment/{_DEPLOYMENT_NAME}", f"service/{_SERVICE_NAME}",
+                "-o", "json",
+            ],
+            capture_output=True
+        )
+        if result.returncode != 0:
+            return None
+        items = json.loads(result.stdout)["items"]
+        deployment = next(item for item in items if item["kind"] == "Deployment")
+        if not any(item["kind"] == "Service" for item in items):
+            return None
+        metadata = deployment["metadata"]
+        status = deployment.get("status", {})
+        replicas = deployment.get("spec", {}).get("replicas", 1)
+        healthy = (
+            status.get("observedGeneration") == metadata["generation"]
+            and status.get("replicas", 0) == replicas
+            and status.get("updatedReplicas", 0) == replicas
+            and status.get("availableReplicas", 0) == replicas
+        )
+        return {"uid": metadata["uid"], "generation": metadata["generation"], "healthy": healthy}
+    except (OSError, ValueError, KeyError, TypeError, StopIteration):
+        return None
+
+
+def _already_applied(marker: Path, digest: str) -> bool:
+    """Whether the marker records this digest and the live deployment is still the healthy result of it."""
+    try:
+        recorded = json.loads(marker.read_text())
+    except (OSError, ValueError):
+        return False
+    if not isinstance(recorded, dict) or recorded.get("digest") != digest:
+        return False
+    
+    state = _deployment_state()
+    return (
+        state is not None
+        and state["healthy"]
+        and recorded.get("uid") == state["uid"]
+        and recorded.get("generation") == state["generation"]
+    )
+
+
+def _record_applied(marker: Path, digest: str) -> None:
+    """Remember which Deployment generation these manifests produced."""
+    state = _deployment_state()
+    if state is None:
+        return
+    try:
+        marker.write_text(json.dumps({
+            "digest": digest,
+            "uid": state["uid"],
+            "generation": state["generation"],
+        }))
+    except OSError as e:
+        typer.echo(f"   Could not record applied manifests in {marker}: {e}")
+
+
 def generate_fastapi_manifests(
     output_dir: Path,
     image: str,
@@ -60,51 +331,20 @@ def generate_fastapi_manifests(
     if load_image:
         load_image_to_minikube(image)
     
-    # Default values
-    port = 8000
-    node_port = 30080
-    replicas = 1
-    cpu_request = "250m"
-    memory_request = "512Mi"
-    cpu_limit = "500m"
-    memory_limit = "1Gi"
-    service_name = "fastapi-service"
-    
-    # Load templates from files
-    template_dir = TEMPLATE_DIR / "kubernetes_local"
-    env = Environment(loader=FileSystemLoader(str(template_dir)))
-    
-    deployment_template = env.get_template("deployment.yaml.j2")
-    service_template = env.get_template("service.yaml.j2")
-    
-    # Render templates
-    deployment_yaml = deployment_template.render(
-        image=image,
-        port=port,
-        replicas=replicas,
-        cpu_request=cpu_request,
-        memory_request=memory_request,
-        cpu_limit=cpu_limit,
-        memory_limit=memory_limit,
-        mlflow_tracking_uri=mlflow_tracking_uri
-    )
-    
-    service_yaml = service_template.render(
-        service_name=service_name,
-        port=port,
-        node_port=node_port
-    )
+    deployment_yaml, service_yaml = _render_fastapi_manifests(image, mlflow_tracking_uri)
     
     # Write files
     deployment_file = output_dir / "deployment.yaml"
     service_file = output_dir / "service.yaml"
     
-    deployment_file.write_text(deployment_yaml)
-    service_file.write_text(service_yaml)
+    _write_if_changed(deployment_file, deployment_yaml)
+    _write_if_changed(service_file, service_yaml)
     
-    typer.echo(f"Generated manifests in {output_dir}")
-    typer.echo(f"   - {deployment_file}")
-    typer.echo(f"   - {service_file}")
+    typer.echo(
+        f"Generated manifests in {output_dir}\n"
+        f"   - {deployment_file}\n"
+        f"   - {service_file}"
+    )
 
 
 def generate_mlflow_manifests(
@@ -130,58 +370,37 @@ def generate_mlflow_manifests(
     if load_image:
         load_image_to_minikube(image)
     
-    # Default values
-    port = 5000
-    node_port = 30050
-    replicas = 1
-    cpu_request = "250m"
-    memory_request = "512Mi"
-    cpu_limit = "500m"
-    memory_limit = "1Gi"
-    service_name = "mlflow-service"
-    
     # Defaults if not provided
     if not backend_store_uri:
         backend_store_uri = "sqlite:///mlflow.db"
     if not artifact_root:
         artifact_root = "/mlflow-artifacts"
     
-    # Load templates from files
-    template_dir = TEMPLATE_DIR / "kubernetes_local"
-    env = Environment(loader=FileSystemLoader(str(template_dir)))
-    
-    deployment_template = env.get_template("mlflow-deployment.yaml.j2")
-    service_template = env.get_template("mlflow-service.yaml.j2")
+    deployment_template, service_template = _get_templates(
+        "mlflow-deployment.yaml.j2", "mlflow-service.yaml.j2"
+    )
     
     # Render templates
     deployment_yaml = deployment_template.render(
         image=image,
-        port=port,
-        replicas=replicas,
-        cpu_request=cpu_request,
-        memory_request=memory_request,
-        cpu_limit=cpu_limit,
-        memory_limit=memory_limit,
         backend_store_uri=backend_store_uri,
-        artifact_root=artifact_root
-    )
-    
-    service_yaml = service_template.render(
-        service_name=service_name,
-        port=port,
-        node_port=node_port
+        artifact_root=artifact_root,
+        **_MLFLOW_DEPLOYMENT_CTX
     )
+    service_yaml = service_template.render(_MLFLOW_SERVICE_CTX)
     
     # Write files
     deployment_file = output_dir / "deployment.yaml"
     service_file = output_dir / "service.yaml"
     
-    deployment_file.write_text(deployment_yaml)
-    service_file.write_text(service_yaml)
+    _write_if_changed(deployment_file, deployment_yaml.encode("utf-8"))
+    _write_if_changed(service_file, service_yaml.encode("utf-8"))
     
-    typer.echo(f"Generated MLflow manifests in {output_dir}")
-    typer.echo(f"   - {deployment_file}")
-    typer.echo(f"   - {service_file}")
+    typer.echo(
+        f"Generated MLflow manifests in {output_dir}\n"
+        f"   - {deployment_file}\n"
+        f"   - {service_file}"
+    )
 
 
 def deploy_mlflow_to_minikube(manifest_dir: Path, image_name: Optional[str] = None) -> bool:
@@ -221,73 +440,73 @@ def deploy_mlflow_to_minikube(manifest_dir: Path, image_name: Optional[str] = No
     typer.echo("Applying Kubernetes manifests...")
     
     try:
-        typer.echo(f"   Applying {deployment_file.name}...")
-        result = subprocess.run(
-            ["kubectl", "apply", "-f", str(deployment_file)],
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        typer.echo(f"{result.stdout.strip()}")
-        
-        # Apply service
-        typer.echo(f"   Applying {service_file.name}...")
+        # Apply deployment and service in a single kubectl invocation
+        typer.echo(f"   Applying {deployment_file.name} and {service_file.name}...")
         result = subprocess.run(
-            ["kubectl", "apply", "-f", str(service_file)],
+            [_KUBECTL, "apply", "-f", str(deployment_file), "-f", str(service_file)],
             check=True,
-            capture_output=True,
-            text=True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
         )
-        typer.echo(f"{result.stdout.strip()}")
+        typer.echo(result.stdout.decode("utf-8", "replace").strip())
         
-        # Get service URL
-        typer.echo("\n Getting service URL...")
-        
-        # Try minikube service --url with timeout (can hang)
-        try:
-            result = subprocess.run(
-                ["minikube", "service", "mlflow-service", "--url"],
-                capture_output=True,
-                text=True,
-                timeout=5  # 5 second timeout to prevent hanging
-            )
-            
-            if result.returncode == 0 and result.stdout.strip():
-                service_url = result.stdout.strip()
-                typer.echo(f"MLflow service is available at: {service_url}")
-            else:
-                raise subprocess.TimeoutExpired("", 5)  # Fall through to fallback
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
-            # Fallback: get NodePort manually (more reliable)
-            typer.echo("   Getting NodePort...")
-            result = subprocess.run(
-                ["kubectl", "get", "svc", "mlflow-service", "-o", "jsonpath='{.spec.ports[0].nodePort}'"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                node_port = result.stdout.strip().strip("'")
-                minikube_ip_result = subprocess.run(
-                    ["minikube", "ip"],
+        # The status listings don't depend on the URL lookup, so fetch them
+        # concurrently with it and print them once it finishes
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            status_futures = [
+                executor.submit(
+                    subprocess.run,
+                    [_KUBECTL, "get", resource, "-l", "app=mlflow"],
                     capture_output=True,
                     text=True
                 )
-                if minikube_ip_result.returncode == 0:
-                    minikube_ip = minikube_ip_result.stdout.strip()
-                    typer.echo(f"MLflow service: http://{minikube_ip}:{node_port}")
+                for resource in ("pods", "svc")
+            ]
+            
+            # Get service URL
+            typer.echo("\n Getting service URL...")
+            
+            # Try minikube service --url with timeout (can hang)
+            try:
+                result = subprocess.run(
+                    [_MINIKUBE, "service", "mlflow-service", "--url"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5  # 5 second timeout to prevent hanging
+                )
+                
+                if result.returncode == 0 and result.stdout.strip():
+                    service_url = result.stdout.strip()
+                    typer.echo(f"MLflow service is available at: {service_url}")
                 else:
-                    typer.echo("   Could not determine minikube IP")
-            else:
-                typer.echo("   Could not determine service URL. Check with: kubectl get svc mlflow-service")
-        
-        typer.echo("\n Deployment status:")
-        subprocess.run(["kubectl", "get", "pods", "-l", "app=mlflow"])
-        subprocess.run(["kubectl", "get", "svc", "-l", "app=mlflow"])
+                    raise subprocess.TimeoutExpired("", 5)  # Fall through to fallback
+            except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
+                # Fallback: get NodePort manually (more reliable)
+                typer.echo("   Getting NodePort...")
+                result = subprocess.run(
+                    [_KUBECTL, "get", "svc", "mlflow-service", "-o", "json"],
+                    capture_output=True
+                )
+                node_port = _node_port(result.stdout) if result.returncode == 0 else None
+                if node_port is not None:
+                    try:
+                        minikube_ip = _minikube_ip()
+                        typer.echo(f"MLflow service: http://{minikube_ip}:{node_port}")
+                    except subprocess.CalledProcessError:
+                        typer.echo("   Could not determine minikube IP")
+                else:
+                    typer.echo("   Could not determine service URL. Check with: kubectl get svc mlflow-service")
+            
+            status_lines = ["\n Deployment status:"]
+            for future in status_futures:
+                status = future.result()
+                status_lines.append((status.stdout or status.stderr).rstrip())
+            typer.echo("\n".join(status_lines))
         
         return True
         
     except subprocess.CalledProcessError as e:
-        typer.echo(f"Deployment failed: {e.stderr}")
+        typer.echo(f"Deployment failed: {e.output.decode('utf-8', 'replace').strip()}")
         return False
     except FileNotFoundError:
         typer.echo("kubectl command not found. Please install kubectl first.")
@@ -313,91 +532,144 @@ def deploy_fastapi_to_minikube(manifest_dir: Path, image_name: Optional[str] = N
         typer.echo(f"Required manifest files not found in {manifest_dir}")
         return False
     
-    # Extract image name from deployment if not provided
-    if not image_name:
-        try:
-            content = deployment_file.read_text()
-            import re
-            match = re.search(r'image:\s*([^\s]+)', content)
-            if match:
-                image_name = match.group(1)
-        except Exception:
-            pass
-    
-    # Load image if provided
-    if image_name:
-        load_image_to_minikube(image_name)
-    
-    typer.echo("Applying Kubernetes manifests...")
+    # Skip loading the image and applying when these exact manifests produced
+    # the deployment and service that are running now and they are healthy.
+    # An explicit image always deploys, so the image is (re)loaded into minikube.
+    digest = _manifest_digest(deployment_file, service_file)
+    applied_marker = manifest_dir / _APPLIED_MARKER
+    skip_apply = not image_name and _already_applied(applied_marker, digest)
     
-    try:
-        typer.echo(f"   Applying {deployment_file.name}...")
-        result = subprocess.run(
-            ["kubectl", "apply", "-f", str(deployment_file)],
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        typer.echo(f"{result.stdout.strip()}")
-        
-        # Apply service
-        typer.echo(f"   Applying {service_file.name}...")
-        result = subprocess.run(
-            ["kubectl", "apply", "-f", str(service_file)],
-            check=True,
-            capture_output=True,
-            text=True
-        )
-        typer.echo(f"{result.stdout.strip()}")
+    if skip_apply:
+        typer.echo("Manifests unchanged since the last deploy and the deployment is healthy; skipping apply.")
+    else:
+        # Extract image name from deployment if not provided
+        if not image_name:
+            try:
+                content = deployment_file.read_text()
+                import re
+                match = re.search(r'image:\s*([^\s]+)', content)
+                if match:
+                    image_name = match.group(1)
+            except Exception:
+                pass
         
-        # Get service URL
-        typer.echo("\n Getting service URL...")
+        # Load image if provided
+        if image_name:
+            load_image_to_minikube(image_name)
         
-        # Try minikube service --url with timeout (can hang)
-        try:
-            result = subprocess.run(
-                ["minikube", "service", "fastapi-service", "--url"],
-                capture_output=True,
-                text=True,
-                timeout=5  # 5 second timeout to prevent hanging
-            )
-            
-            if result.returncode == 0 and result.stdout.strip():
-                service_url = result.stdout.strip()
-                typer.echo(f"FastAPI service is available at: {service_url}")
-            else:
-                raise subprocess.TimeoutExpired("", 5)  # Fall through to fallback
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
-            # Fallback: get NodePort manually (more reliable)
-            typer.echo("   Getting NodePort...")
+        typer.echo("Applying Kubernetes manifests...")
+    
+    try:
+        if not skip_apply:
+            # Apply deployment and service in a single kubectl invocation
+            typer.echo(f"   Applying {deployment_file.name} and {service_file.name}...")
             result = subprocess.run(
-                ["kubectl", "get", "svc", "fastapi-service", "-o", "jsonpath='{.spec.ports[0].nodePort}'"],
-                capture_output=True,
-                text=True
+                [_KUBECTL, "apply", "-f", str(deployment_file), "-f", str(service_file)],
+                check=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT
             )
-            if result.returncode == 0:
-                node_port = result.stdout.strip().strip("'")
-                minikube_ip_result = subprocess.run(
-                    ["minikube", "ip"],
+            typer.echo(result.stdout.decode("utf-8", "replace").strip())
+            _record_applied(applied_marker, digest)
+        
+        # The status listings don't depend on the URL lookup, so fetch them
+        # concurrently with it and print them once it finishes
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            status_futures = [
+                executor.submit(
+                    subprocess.run,
+                    [_KUBECTL, "get", resource, "-l", "app=fastapi"],
                     capture_output=True,
                     text=True
                 )
-                if minikube_ip_result.returncode == 0:
-                    minikube_ip = minikube_ip_result.stdout.strip()
-                    typer.echo(f"FastAPI service: http://{minikube_ip}:{node_port}")
+                for resource in ("pods", "svc")
+            ]
+            
+            # Get service URL
+            typer.echo("\n Getting service URL...")
+            
+            # Try minikube service --url with timeout (can hang)
+            try:
+                result = subprocess.run(
+                    [_MINIKUBE, "service", _SERVICE_NAME, "--url"],
+                    capture_output=True,
+                    text=True,
+                    timeout=5  # 5 second timeout to prevent hanging
+                )
+                
+                if result.returncode == 0 and result.stdout.strip():
+                    service_url = result.stdout.strip()
+                    typer.echo(f"FastAPI service is available at: {service_url}")
                 else:
-                    typer.echo("   Could not determine minikube IP")
-            else:
-                typer.echo("   Could not determine service URL. Check with: kubectl get svc fastapi-service")
-        
-        typer.echo("\n Deployment status:")
-        subprocess.run(["kubectl", "get", "pods", "-l", "app=fastapi"])
-        subprocess.run(["kubectl", "get", "svc", "-l", "app=fastapi"])
+                    raise subprocess.TimeoutExpired("", 5)  # Fall through to fallback
+            except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
+                # Fallback: get NodePort manually (more reliable)
+                typer.echo("   Getting NodePort...")
+                result = subprocess.run(
+                    [_KUBECTL, "get", "svc", _SERVICE_NAME, "-o", "json"],
+                    capture_output=True
+                )
+                node_port = _node_port(result.stdout) if result.returncode == 0 else None
+                if node_port is not None:
+                    try:
+                        minikube_ip = _minikube_ip()
+                        typer.echo(f"FastAPI service: http://{minikube_ip}:{node_port}")
+                    except subprocess.CalledProcessError:
+                        typer.echo("   Could not determine minikube IP")
+                else:
+                    typer.echo(f"   Could not determine service URL. Check with: kubectl get svc {_SERVICE_NAME}")
+            
+            status_lines = ["\n Deployment status:"]
+            for future in status_futures:
+                status = future.result()
+                status_lines.append((status.stdout or status.stderr).rstrip())
+            typer.echo("\n".join(status_lines))
         
         return True
         
     except subprocess.CalledProcessError as e:
-        typer.echo(f"Deployment failed: {e.stderr}")
+        typer.echo(f"Deployment failed: {e.output.decode('utf-8', 'replace').strip()}")
+        return False
+    except FileNotFoundError:
+        typer.echo("kubectl command not found. Please install kubectl first.")
+        return False
+
+
+def deploy_fastapi_direct(
+    image: str,
+    mlflow_tracking_uri: Optional[str] = None,
+    load_image: bool = True,
+) -> bool:
+    """
+    Deploy FastAPI to minikube without writing manifests to disk.
+    
+    The rendered manifests are piped to a single server-side
+    `kubectl apply -f -`. Use generate_fastapi_manifests and
+    deploy_fastapi_to_minikube when the manifest files are wanted.
+    
+    Args:
+        image: Docker image for FastAPI
+        mlflow_tracking_uri: Optional MLflow tracking URI
+        load_image: Whether to automatically load image into minikube (default: True)
+    """
+    if load_image:
+        load_image_to_minikube(image)
+    
+    deployment_yaml, service_yaml = _render_fastapi_manifests(image, mlflow_tracking_uri)
+    
+    typer.echo("Applying Kubernetes manifests...")
+    try:
+        result = subprocess.run(
+            [_KUBECTL, "apply", "--server-side", "-f", "-"],
+            input=deployment_yaml + b"\n---\n" + service_yaml,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
+        )
+        typer.echo(result.stdout.decode("utf-8", "replace").strip())
+        return True
+    except subprocess.CalledProcessError as e:
+        typer.echo(f"Deployment failed: {e.output.decode('utf-8', 'replace').strip()}")
         return False
     except FileNotFoundError:
         typer.echo("kubectl command not found. Please install kubectl first.")
@@ -417,8 +689,7 @@ def load_image_to_minikube(image_name: str) -> bool:
     # Check if image exists locally
     result = subprocess.run(
         ["docker", "images", "-q", image_name],
-        capture_output=True,
-        text=True
+        capture_output=True
     )
     
     if not result.stdout.strip():
@@ -428,27 +699,25 @@ def load_image_to_minikube(image_name: str) -> bool:
     
     # Check if image is already in minikube
     result = subprocess.run(
-        ["minikube", "image", "ls"],
-        capture_output=True,
-        text=True
+        [_MINIKUBE, "image", "ls"],
+        capture_output=True
     )
     
-    if image_name in result.stdout:
+    if image_name.encode("utf-8") in result.stdout:
         typer.echo(f"✅ Image '{image_name}' already in minikube")
         return True
     
     # Load image into minikube
     typer.echo(f"📦 Loading image '{image_name}' into minikube...")
     result = subprocess.run(
-        ["minikube", "image", "load", image_name],
+        [_MINIKUBE, "image", "load", image_name],
         check=True,
-        capture_output=True,
-        text=True
+        capture_output=True
     )
     
     if result.returncode == 0:
         typer.echo(f"✅ Image '{image_name}' loaded into minikube")
         return True
     else:
-        typer.echo(f"❌ Failed to load image: {result.stderr}")
+        typer.echo(f"❌ Failed to load image: {result.stderr.decode('utf-8', 'replace')}")
         return False
\ No newline at end of file